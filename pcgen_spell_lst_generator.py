@@ -1,9 +1,11 @@
 import datetime
+from functools import partial
 from tkinter import *
 from tkinter import filedialog
 from tkinter import messagebox
 from tktooltip import ToolTip
 import os
+import sys
 
 """
 KNOWN ISSUES:
@@ -30,11 +32,93 @@ v1.1.4: When user saves spells to a .lst, will now attempt to validate that the
 """
 
 PCGEN_TAB_SIZE = 6  # Used to format field spacing when writing to a .lst file
+NAME_FIELD_WIDTH = 6  # Width of the spell name column, in tabs
+# Padding after the spell name, indexed by how many full tabs the name itself spans (capped at NAME_FIELD_WIDTH)
+NAME_TAB_PADDING = tuple("\t" * (NAME_FIELD_WIDTH - i) for i in range(NAME_FIELD_WIDTH + 1))
+# Width of each column after the spell name, in tabs, for PF1e/3.5e and for 5e (which drops SR, target and descriptors)
+LST_FIELD_WIDTHS = {'type': 4, 'school': 4, 'subschool': 4, 'casting_time': 5, 'range': 4, 'duration': 10, 'save': 7,
+                    'sr': 4, 'target': 10, 'comps': 3, 'classes': 10, 'descriptors': 7}
+LST_FIELD_WIDTHS_5E = {'type': 4, 'school': 4, 'subschool': 3, 'casting_time': 5, 'range': 4, 'duration': 7, 'save': 4,
+                       'sr': 0, 'target': 0, 'comps': 11, 'classes': 10, 'descriptors': 0}
+# Padding strings indexed by number of tabs, covering any column padding (at most a field's width plus one)
+TAB_STRINGS = tuple("\t" * i for i in range(max(*LST_FIELD_WIDTHS.values(), *LST_FIELD_WIDTHS_5E.values()) + 2))
+# Plain-text fields written between the subschool and components columns, in order
+LST_TEXT_FIELDS = ("casting_time", "range", "duration", "save", "sr", "target")
+LST_TEXT_FIELDS_5E = ("casting_time", "range", "duration", "save")
+# .lst tags holding a single plain-text value, mapped to the Spell() argument they populate
+LST_TEXT_TAGS = {"SCHOOL": 'school', "SUBSCHOOL": 'subschool', "CASTTIME": 'casting_time', "RANGE": 'spell_range',
+                 "DURATION": 'duration', "TARGETAREA": 'target', "SAVEINFO": 'save', "SPELLRES": 'sr', "DESC": 'desc'}
+# Entries of a .lst COMPS tag, mapped to the spell component flag(s) they set
+LST_COMP_FLAGS = {"V": ('verbal',), "S": ('somatic',), "M": ('material',), "F": ('focus',), "DF": ('divine_focus',),
+                  "F/DF": ('focus', 'divine_focus')}
+# Spell() arguments for a parsed .lst line that default to immutable values; lists are created fresh for each spell
+LST_SPELL_DEFAULTS = {'class_suffix': "", 'verbal': False, 'somatic': False, 'material': False, 'focus': False,
+                      'divine_focus': False, 'arcane': False, 'divine': False, 'psychic': False, 'school': "",
+                      'casting_time': "", 'spell_range': "", 'duration': "", 'desc': "", 'sr': "", 'save': "",
+                      'target': "", 'subschool': "", 'material_desc': ""}
+# PCGen GAMEMODE and source TYPE written to a generated .pcc file, per system
+PCC_GAME_MODES = {"Pathfinder 1e": ("Pathfinder", "PathfinderHomebrew"), "D&D 3.5e": ("35e", "35Homebrew"),
+                  "D&D 5e": ("5e", "5eHomebrew")}
+# Casting classes available in the spell editor, grouped by spell type, per system
+CASTER_TYPES = {"Pathfinder 1e": {'arcane': ("Alchemist", "Bard", "Bloodrager", "Magus", "Summoner", "Witch", "Wizard"),
+                                  'divine': ("Antipaladin", "Cleric", "Druid", "Hunter", "Inquisitor", "Paladin",
+                                             "Ranger", "Shaman"),
+                                  'psychic': ("Medium", "Mesmerist", "Occultist", "Psychic", "Spiritualist")},
+                "D&D 3.5e": {'arcane': ("Bard", "Wizard"),
+                             'divine': ("Blackguard", "Cleric", "Druid", "Paladin")},
+                             #'psionic': ("Psion", "Wilder", "Psychic Warrior")
+                "D&D 5e": {'arcane': ("Artificer", "Bard", "Sorcerer", "Warlock", "Warlock Book of Shadows", "Wizard"),
+                           'divine': ("Cleric", "Druid", "Paladin", "Ranger")}}
+# All casting classes in dropdown order, per system
+CASTER_CLASSES = {mode: tuple(caster for casters in caster_types.values() for caster in casters)
+                  for (mode, caster_types) in CASTER_TYPES.items()}
+# Reverse lookup of spell type by casting class, per system
+CLASS_SPELL_TYPES = {mode: {caster: spell_type for (spell_type, casters) in caster_types.items() for caster in casters}
+                     for (mode, caster_types) in CASTER_TYPES.items()}
+# Subschools selectable for each school, per system.  5e has no subschools, so the field is used for the Ritual tag.
+SUBSCHOOLS = {"Pathfinder 1e": {'Abjuration': ("",),
+                                'Conjuration': ("", "Calling", "Creation", "Healing", "Summoning", "Teleportation"),
+                                'Divination': ("", "Scrying"), 'Enchantment': ("", "Charm", "Compulsion"),
+                                'Evocation': ("",),
+                                'Illusion': ("", "Figment", "Glamer", "Pattern", "Phantasm", "Shadow"),
+                                'Necromancy': ("",), 'Transmutation': ("", "Polymorph"), 'Universal': ("",)},
+              "D&D 3.5e": {'Abjuration': ("",), 'Conjuration': ("", "Calling", "Creation", "Healing", "Summoning"),
+                           'Divination': ("", "Scrying"), 'Enchantment': ("", "Charm", "Compulsion"),
+                           'Evocation': ("",), 'Illusion': ("", "Figment", "Glamer", "Pattern", "Phantasm", "Shadow"),
+                           'Necromancy': ("",), 'Transmutation': ("",), 'Universal': ("",)},
+              "D&D 5e": {school: ("", "Ritual") for school in ("Abjuration", "Conjuration", "Divination",
+                                                               "Enchantment", "Evocation", "Illusion", "Necromancy",
+                                                               "Transmutation")}}
+# Systems whose .lst files list Sorcerer alongside Wizard, so the editor adds and removes the two together
+WIZARD_SORCERER_SYSTEMS = frozenset({"Pathfinder 1e", "D&D 3.5e"})
+# Descriptors selectable in the spell editor, per system.  5e spells have no descriptors.
+DESCRIPTORS = {"Pathfinder 1e": ("Acid", "Air", "Chaotic", "Cold", "Curse", "Darkness", "Death", "Disease", "Draconic",
+                                 "Earth", "Electricity", "Emotion", "Evil", "Fear", "Fire", "Force", "Good",
+                                 "Language-Dependent", "Lawful", "Light", "Meditative", "Mind-Affecting", "Pain",
+                                 "Poison", "Shadow", "Sonic", "Water"),
+               "D&D 3.5e": ("Acid", "Air", "Chaos", "Chaotic", "Cold", "Compulsion", "Creation", "Darkness", "Death",
+                            "Earth", "Ectomancy", "Electricity", "Evil", "Fear", "Fire", "Fire or Cold", "Force",
+                            "Glamer", "Good", "Good or Evil", "Ice", "Incarnum", "Investiture", "Language-Dependent",
+                            "Law", "Lawful", "Light", "Mind-Affecting", "Mindset", "Pattern", "Shadow", "Summoning",
+                            "Teleportation", "Water")}
+# Spell editor fields that SpellEditor.add_spell sets up separately rather than copying in its generic field loop
+EDITOR_SPECIAL_FIELDS = frozenset({"desc", "other", "name", "sr"})
+# Spell fields whose values repeat across most spells, so one string object is shared per distinct value
+INTERNED_FIELDS = ('school', 'subschool', 'casting_time')
+# Spell editor fields whose text is normalized to sentence case (e.g., "Will negates") when a spell is saved
+CAPITALIZED_FIELDS = frozenset({"range", "save"})
 VERSION = "1.1.4"
 BUILD_DATE = "15 July 2022"
 
 
 class Spell:
+    __slots__ = ('fields', 'classes', 'type', 'descriptors', 'comps', 'other_fields', 'mode', 'lst_cache', 'name_key')
+    # .lst tag for each field.  These never vary between spells, so they are shared by the class rather than rebuilt
+    #  for every instance.
+    tags = {'school': "SCHOOL:", 'subschool': "SUBSCHOOL:", 'casting_time': "CASTTIME:", 'range': "RANGE:",
+            'save': "SAVEINFO:", 'target': "TARGETAREA:", 'duration': "DURATION:", 'sr': "SPELLRES:", 'desc': "DESC:",
+            'type': "TYPE:", 'descriptors': "DESCRIPTOR:", 'comps': "COMPS:"}
+
     def __init__(self, name: str, classes_by_level: list, school: str, casting_time: str, spell_range: str,
                  duration: str, desc: str, arcane: bool = False, divine: bool = False, psychic: bool = False,
                  save: str = "", sr: str = "", target: str = "", descriptors: list = (), subschool: str = "",
@@ -73,278 +157,192 @@ class Spell:
         :param mode: Valid values are "Pathfinder 1e", "D&D 3.5e", or "D&D 5e" (affects how spells get written to .lst)
         """
 
-        self.fields = {}
-        self.type = {}
-        self.comps = {}
-        self.tags = {}
-        self.fields['name'] = name.strip()
+        fields = (('name', name), ('school', school), ('subschool', subschool), ('casting_time', casting_time),
+                  ('range', spell_range), ('save', save), ('target', target), ('duration', duration), ('sr', sr),
+                  ('desc', desc), ('material_desc', material_desc), ('class_suffix', class_suffix))
+        self.fields = {key: value.strip() for (key, value) in fields}
+        for key in INTERNED_FIELDS:
+            self.fields[key] = sys.intern(self.fields[key])
+        # Upper-cased name used for equality and hashing; the name is never changed after a Spell is created
+        self.name_key = self.fields['name'].upper()
         self.classes = classes_by_level
-        self.fields['school'] = school.strip()
-        self.tags['school'] = "SCHOOL:"
-        self.fields['subschool'] = subschool.strip()
-        self.tags['subschool'] = "SUBSCHOOL:"
-        self.fields['casting_time'] = casting_time.strip()
-        self.tags['casting_time'] = "CASTTIME:"
-        self.fields['range'] = spell_range.strip()
-        self.tags['range'] = "RANGE:"
-        self.fields['save'] = save.strip()
-        self.tags['save'] = "SAVEINFO:"
-        self.fields['target'] = target.strip()
-        self.tags['target'] = "TARGETAREA:"
-        self.fields['duration'] = duration.strip()
-        self.tags['duration'] = "DURATION:"
-        self.fields['sr'] = sr.strip()
-        self.tags['sr'] = "SPELLRES:"
-        self.fields['desc'] = desc.strip()
-        self.tags['desc'] = "DESC:"
-        self.fields['material_desc'] = material_desc.strip()
-        self.fields['class_suffix'] = class_suffix.strip()
-        self.type['arcane'] = arcane
-        self.type['divine'] = divine
-        self.type['psychic'] = psychic
-        self.tags['type'] = "TYPE:"
-        self.descriptors = []
-        for descriptor in descriptors:
-            self.descriptors.append(descriptor.strip())
-        self.tags['descriptors'] = "DESCRIPTOR:"
-        self.comps['verbal'] = verbal
-        self.comps['somatic'] = somatic
-        self.comps['material'] = material
-        self.comps['focus'] = focus
-        self.comps['divine_focus'] = divine_focus
-        self.tags['comps'] = "COMPS:"
-        self.other_fields = []
-        for field in other_fields:
-            self.other_fields.append(field.strip())
+        self.type = {'arcane': arcane, 'divine': divine, 'psychic': psychic}
+        self.descriptors = [sys.intern(descriptor.strip()) for descriptor in descriptors]
+        self.comps = {'verbal': verbal, 'somatic': somatic, 'material': material, 'focus': focus,
+                      'divine_focus': divine_focus}
+        self.other_fields = [field.strip() for field in other_fields]
         self.mode = mode
+        # (mode, string) from the last __str__ call, so unchanged spells aren't re-formatted on every save
+        self.lst_cache = None
 
     def __str__(self) -> str:
         """
         :return: String representation of a spell: the corresponding line in a PCGen .lst file.  Formatted so that
                  most fields are aligned into columns if editor tab with is set to PCGEN_TAB_SIZE (global variable)
+                 Cached per mode; call mark_dirty() after changing a spell's contents.
         """
+        if self.lst_cache is not None and self.lst_cache[0] == self.mode:
+            return self.lst_cache[1]
         excess_tabs = 0
-        field_width = {}
-
-        spell_string = self.fields['name']
-        for i in range(0, 6 - int(len(self.fields['name']) / PCGEN_TAB_SIZE)):
-            spell_string += "\t"
-        if len(self.fields['name']) > 6 * PCGEN_TAB_SIZE:
-            excess_tabs = int((len(self.fields['name']) - 6 * PCGEN_TAB_SIZE) / PCGEN_TAB_SIZE)
+        # Read the most frequently used values out of their dicts once, up front
+        name = self.fields['name']
+        school = self.fields['school']
+        subschool = self.fields['subschool']
+        comps = self.comps
+        # The system mode can't change mid-call, so resolve it once here instead of comparing strings at every field
+        is_5e = self.mode == "D&D 5e"
+        is_pathfinder = self.mode == "Pathfinder 1e"
+        field_width = LST_FIELD_WIDTHS_5E if is_5e else LST_FIELD_WIDTHS
+
+        # Accumulate fragments in a list and join once at the end, rather than re-copying the whole line each time
+        parts = [name, NAME_TAB_PADDING[min(len(name) // PCGEN_TAB_SIZE, NAME_FIELD_WIDTH)]]
+        if len(name) > NAME_FIELD_WIDTH * PCGEN_TAB_SIZE:
+            excess_tabs = (len(name) - NAME_FIELD_WIDTH * PCGEN_TAB_SIZE) // PCGEN_TAB_SIZE
 
         # Generate list of spell types (Arcane, Divine, Psychic)
-        field_width['type'] = 4
         if self.type['arcane'] or self.type['divine'] or self.type['psychic']:
-            spell_string = spell_string + "\tTYPE:"
-            first_type = True
-            type_string_length = 5
+            types = []
             if self.type['arcane']:
-                first_type = False
-                spell_string = spell_string + "Arcane"
-                type_string_length += 6
+                types.append("Arcane")
             if self.type['divine']:
-                if first_type:
-                    first_type = False
-                else:
-                    spell_string = spell_string + "."
-                    type_string_length += 1
-                spell_string = spell_string + "Divine"
-                type_string_length += 6
-            if self.type['psychic'] and self.mode == "Pathfinder 1e":
-                if first_type:
-                    first_type = False
-                else:
-                    spell_string = spell_string + "."
-                    type_string_length += 1
-                spell_string = spell_string + "Psychic"
-                type_string_length += 7
-            if self.mode == "D&D 5e":
-                spell_string = spell_string + ".Spell"
-                type_string_length += 6
-            tabs = (field_width['type'] - int(type_string_length / PCGEN_TAB_SIZE))
+                types.append("Divine")
+            if self.type['psychic'] and is_pathfinder:
+                types.append("Psychic")
+            type_string = ".".join(types)
+            if is_5e:
+                type_string += ".Spell"
+            parts.append("\tTYPE:" + type_string)
+            type_string_length = len(type_string) + 5
+            tabs = (field_width['type'] - type_string_length // PCGEN_TAB_SIZE)
         else:
             tabs = field_width['type'] + 1
-        while tabs > 0 and excess_tabs > 0:
-            tabs -= 1
-            excess_tabs -= 1
-        spell_string = spell_string + "\t" * tabs
-
-        field_width['school'] = 4
-        if len(self.fields['school']) > 0:
-            spell_string = spell_string + "\tSCHOOL:" + self.fields['school']
-            tabs = (field_width['school'] - int((len(self.fields['school']) + 7) / PCGEN_TAB_SIZE))
+        # Let this column's padding absorb as much of any earlier over-sized token as it can
+        if tabs > 0 and excess_tabs > 0:
+            consumed = min(tabs, excess_tabs)
+            tabs -= consumed
+            excess_tabs -= consumed
+        parts.append(TAB_STRINGS[tabs] if tabs > 0 else "")
+
+        if len(school) > 0:
+            parts.append("\tSCHOOL:" + school)
+            tabs = (field_width['school'] - (len(school) + 7) // PCGEN_TAB_SIZE)
         else:
             tabs = field_width['school'] + 1
-        while tabs > 0 and excess_tabs > 0:
-            tabs -= 1
-            excess_tabs -= 1
-        spell_string = spell_string + "\t" * tabs
+        if tabs > 0 and excess_tabs > 0:
+            consumed = min(tabs, excess_tabs)
+            tabs -= consumed
+            excess_tabs -= consumed
+        parts.append(TAB_STRINGS[tabs] if tabs > 0 else "")
 
-        if self.mode == "D&D 5e":
-            field_width['subschool'] = 3
-        else:
-            field_width['subschool'] = 4
         tabs = 0
-        if len(self.fields['subschool']) > 0:
-            spell_string = spell_string + "\tSUBSCHOOL:" + self.fields['subschool']
-            tabs = (field_width['subschool'] - int((len(self.fields['subschool']) + 10) / PCGEN_TAB_SIZE))
+        if len(subschool) > 0:
+            parts.append("\tSUBSCHOOL:" + subschool)
+            tabs = (field_width['subschool'] - (len(subschool) + 10) // PCGEN_TAB_SIZE)
         else:
             tabs = field_width['subschool'] + 1
-        while tabs > 0 and excess_tabs > 0:
-            tabs -= 1
-            excess_tabs -= 1
-        spell_string = spell_string + "\t" * tabs
+        if tabs > 0 and excess_tabs > 0:
+            consumed = min(tabs, excess_tabs)
+            tabs -= consumed
+            excess_tabs -= consumed
+        parts.append(TAB_STRINGS[tabs] if tabs > 0 else "")
 
-        field_width['casting_time'] = 5
-        field_width['range'] = 4
-        if self.mode == "D&D 5e":
-            field_width['duration'] = 7
-            field_width['save'] = 4
-            field_width['sr'] = 0
-            field_width['comps'] = 11
-            field_width['descriptors'] = 0
-            field_width['target'] = 0
-        else:
-            field_width['duration'] = 10
-            field_width['save'] = 7
-            field_width['sr'] = 4
-            field_width['comps'] = 3
-            field_width['descriptors'] = 7
-            field_width['target'] = 10
-        field_width['classes'] = 10
-
-        fields = ["casting_time", "range", "duration", "save"]
-        if self.mode != "D&D 5e":
-            fields.append("sr")
-            fields.append("target")
-        for field in fields:
+        for field in (LST_TEXT_FIELDS_5E if is_5e else LST_TEXT_FIELDS):
             if len(self.fields[field]) > 0:
-                spell_string = spell_string + "\t" + self.tags[field] + self.fields[field]
+                parts.append("\t" + self.tags[field] + self.fields[field])
                 (tabs, et) = self.calculate_tabs(field_name=field, field_width=field_width[field])
                 excess_tabs += et
             else:
                 tabs = field_width[field] + 1
-            while tabs > 0 and excess_tabs > 0:
-                tabs -= 1
-                excess_tabs -= 1
-            spell_string = spell_string + "\t" * tabs
+            if tabs > 0 and excess_tabs > 0:
+                consumed = min(tabs, excess_tabs)
+                tabs -= consumed
+                excess_tabs -= consumed
+            parts.append(TAB_STRINGS[tabs] if tabs > 0 else "")
 
         # Construct list of spell components required
-        if self.comps['verbal'] or self.comps['somatic'] or self.comps['material'] or self.comps['focus'] or\
-            self.comps['divine_focus']:
-            component_string = "\tCOMPS:"
-            first_component = True
-            if self.comps['verbal']:
-                first_component = False
-                component_string = component_string + "V"
-            if self.comps['somatic']:
-                if first_component:
-                    first_component = False
-                else:
-                    component_string = component_string + ","
-                component_string = component_string + "S"
-            if self.comps['material']:
-                if first_component:
-                    first_component = False
+        if comps['verbal'] or comps['somatic'] or comps['material'] or comps['focus'] or comps['divine_focus']:
+            comp_parts = []
+            if comps['verbal']:
+                comp_parts.append("V")
+            if comps['somatic']:
+                comp_parts.append("S")
+            if comps['material']:
+                if len(self.fields['material_desc']) > 0 and is_5e:
+                    comp_parts.append("M (" + self.fields['material_desc'] + ")")
                 else:
-                    component_string = component_string + ","
-                component_string = component_string + "M"
-                if len(self.fields['material_desc']) > 0 and self.mode == "D&D 5e":
-                   component_string = component_string + " (" + self.fields['material_desc'] + ")"
-            if self.mode != "D&D 5e":
-                if self.comps['focus']:
-                    if first_component:
-                        first_component = False
-                    else:
-                        component_string = component_string + ","
-                    component_string = component_string + "F"
-                    if self.comps['divine_focus']:
-                        component_string = component_string + "/DF"
-                elif self.comps['divine_focus']:
-                    if first_component:
-                        first_component = False
-                    else:
-                        component_string = component_string + ","
-                    component_string = component_string + "DF"
-            spell_string = spell_string + component_string
+                    comp_parts.append("M")
+            if not is_5e:
+                if comps['focus'] and comps['divine_focus']:
+                    comp_parts.append("F/DF")
+                elif comps['focus']:
+                    comp_parts.append("F")
+                elif comps['divine_focus']:
+                    comp_parts.append("DF")
+            component_string = "\tCOMPS:" + ",".join(comp_parts)
+            parts.append(component_string)
             (tabs, et) = self.calculate_tabs_raw(token=component_string, field_width=field_width['comps'])
             excess_tabs += et
         else:
             tabs = field_width['comps'] + 1
-        while tabs > 0 and excess_tabs > 0:
-            tabs -= 1
-            excess_tabs -= 1
-        spell_string = spell_string + "\t" * tabs
-
-        classes_found = False
-        for class_level in self.classes:
-            if len(class_level) > 0:
-                classes_found = True
-                break
-        if classes_found:
-            class_string = "\tCLASSES:"
+        if tabs > 0 and excess_tabs > 0:
+            consumed = min(tabs, excess_tabs)
+            tabs -= consumed
+            excess_tabs -= consumed
+        parts.append(TAB_STRINGS[tabs] if tabs > 0 else "")
 
+        if any(self.classes):
             # Construct list of classes that can cast spell at what levels
-            first_level = True
-            for level in range(0, len(self.classes)):
-                if len(self.classes[level]) > 0:
-                    if first_level:
-                        first_level = False
-                    else:
-                        class_string += "|"
-                    first_class = True
-                    for class_name in self.classes[level]:
-                        if first_class:
-                            first_class = False
-                        else:
-                            class_string += ","
-                        class_string += class_name
-                    class_string += "=" + str(level)
-            if len(self.fields['class_suffix']) > 0:
-                class_string += self.fields['class_suffix']
-            spell_string = spell_string + class_string
+            level_parts = [",".join(casters) + "=" + str(level)
+                           for (level, casters) in enumerate(self.classes) if len(casters) > 0]
+            class_string = "\tCLASSES:" + "|".join(level_parts) + self.fields['class_suffix']
+            parts.append(class_string)
             (tabs, et) = self.calculate_tabs_raw(token=class_string, field_width=field_width['classes'])
             excess_tabs += et
         else:
             tabs = (field_width['classes'] + 1)
-        while tabs > 0 and excess_tabs > 0:
-            tabs -= 1
-            excess_tabs -= 1
-        spell_string = spell_string + "\t" * tabs
+        if tabs > 0 and excess_tabs > 0:
+            consumed = min(tabs, excess_tabs)
+            tabs -= consumed
+            excess_tabs -= consumed
+        parts.append(TAB_STRINGS[tabs] if tabs > 0 else "")
 
         tabs = 0
         if len(self.descriptors) > 0:
-            descriptor_string = "\tDESCRIPTOR:"
-            first_descriptor = True
-            for descriptor in self.descriptors:
-                if first_descriptor:
-                    first_descriptor = False
-                else:
-                    descriptor_string = descriptor_string + "|"
-                descriptor_string = descriptor_string + descriptor
-            spell_string += descriptor_string
+            descriptor_string = "\tDESCRIPTOR:" + "|".join(self.descriptors)
+            parts.append(descriptor_string)
             (tabs, et) = self.calculate_tabs_raw(token=descriptor_string, field_width=field_width['descriptors'])
             excess_tabs += et
-        elif self.mode != "D&D 5e":
+        elif not is_5e:
             tabs = field_width['descriptors'] + 1
-        while tabs > 0 and excess_tabs > 0:
-            tabs -= 1
-            excess_tabs -= 1
-        spell_string = spell_string + "\t" * tabs
+        if tabs > 0 and excess_tabs > 0:
+            consumed = min(tabs, excess_tabs)
+            tabs -= consumed
+            excess_tabs -= consumed
+        parts.append(TAB_STRINGS[tabs] if tabs > 0 else "")
 
         if len(self.fields['desc']) > 0:
-            spell_string = spell_string + "\t\tDESC:" + self.fields['desc']
+            parts.append("\t\tDESC:" + self.fields['desc'])
 
         if len(self.other_fields) > 0:
             for field in self.other_fields:
                 if len(field.strip()) > 0:
-                    spell_string = spell_string + "\t\t" + field.strip()
+                    parts.append("\t\t" + field.strip())
 
+        spell_string = "".join(parts)
+        self.lst_cache = (self.mode, spell_string)
         return spell_string
 
+    def mark_dirty(self) -> None:
+        """ Discards the cached .lst line, so the next __str__ call re-formats the spell from its current contents. """
+        self.lst_cache = None
+
     def __eq__(self, other) -> bool:
         """ Two Spells are considered the same if they share a common name, case-insensitive. """
-        return self.fields['name'].upper() == other.fields['name'].upper()
+        return self.name_key == other.name_key
+
+    def __hash__(self) -> int:
+        """ Hashes on the upper-cased name, consistent with __eq__. """
+        return hash(self.name_key)
 
     def calculate_tabs(self, field_name: str, field_width: int) -> tuple:
         """
@@ -371,25 +369,27 @@ class Spell:
                  it is larger than the designated field width.  This second value is used to reduce the tab padding of
                  subsequent tokens in order to try to "catch up" when this token is over-sized.
         """
-        token = token.strip()
-        tabs = (field_width - int(len(token) / PCGEN_TAB_SIZE))
+        # Callers may pass the token with its leading tab separator, which doesn't count towards its width
+        token_tabs = len(token.strip()) // PCGEN_TAB_SIZE
+        tabs = field_width - token_tabs
         excess_tabs = 0
-        if len(token) > field_width * PCGEN_TAB_SIZE:
-            excess_tabs = int(len(token) / PCGEN_TAB_SIZE) - field_width
+        if token_tabs > field_width:
+            excess_tabs = token_tabs - field_width
         return (tabs, excess_tabs)
 
 
 class SpellGenerator:
-    def __init__(self, spells=[], mods=[]):
+    def __init__(self, spells: list = None, mods: list = None):
         """
         Initialize the SpellGenerator class mainly by building all the GUI elements.  This maintains the list of spells
         for each system, as well as the loading/saving of the list to file.  It contains a SpellEditor instance to
         edit/create individual spells.
 
-        :param spells: Starting spell list, if any (defaults to empty list).  Stored in list as type Spell.
+        :param spells: Starting spell list, if any (defaults to empty list).  Stored in list as type Spell.  The list is
+                        copied, so the caller's list is not modified when spells are added/removed.
         :param mods: Starting list of spell mods, represented as strings (defaults to empty list).  This class does not
                         handle .MODs in any way except to store them when loaded from a .lst file so that they can be
-                        preserved and written back when the spells are saved to a .lst file.
+                        preserved and written back when the spells are saved to a .lst file.  Also copied.
         """
         modes = ("Pathfinder 1e", "D&D 3.5e", "D&D 5e")
         self.config_file = "pcg_spell_lst_generator.cfg"
@@ -402,11 +402,16 @@ class SpellGenerator:
         self.win.focus_set()
         self.system_mode = StringVar(self.win)
         self.system_mode.set(self.default_system)
-        self.spell_list = {}
+        self.spell_list = {mode: [] for mode in modes}
+        if spells is not None:
+            self.spell_list[self.system_mode.get()].extend(spells)
+        self.mod_list = list(mods) if mods is not None else []
+        # Per-system lookup of spells by exact name, kept in sync with spell_list for fast duplicate checks
+        self.spell_index = {}
         for mode in modes:
-            self.spell_list[mode] = []
-        self.spell_list[self.system_mode.get()] = spells
-        self.mod_list = mods
+            self.index_spells(mode)
+        # .lst files written by this tool during this session, which can be overwritten again without checking them
+        self.saved_lst_files = set()
 
         menubar = Menu(self.win)
         file_menu = Menu(menubar, tearoff=0)
@@ -437,9 +442,7 @@ class SpellGenerator:
         self.scrollbar.pack(side=RIGHT, fill=BOTH)
 
         self.spell_lb = Listbox(self.spell_list_frame, height=30, width=30, selectmode=SINGLE, font=('Arial', 10))
-
-        for spell in self.spell_list[self.system_mode.get()]:
-            self.spell_lb.insert(END, spell.fields['name'])
+        self.refresh_spell_lb()
         self.spell_lb.config(yscrollcommand=self.scrollbar.set)
         self.scrollbar.config(command=self.spell_lb.yview)
         self.spell_lb.pack(fill=BOTH, expand=True)
@@ -455,8 +458,10 @@ class SpellGenerator:
                                           command=self.remove_spell)
         self.remove_spell_button.pack(side=LEFT, pady=(0, 10))
 
-        # Build spell editing frame
+        # Build spell editing frame.  Its widgets depend on the system, so one editor is kept per system and swapped in
+        #  by set_system() rather than rebuilt on every switch.
         self.spell_editor = SpellEditor(master=self.win, generator=self)
+        self.spell_editors = {self.system_mode.get(): self.spell_editor}
         self.spell_editor.pack(side=RIGHT, fill=BOTH, expand=True)
 
     def run(self) -> None:
@@ -465,34 +470,60 @@ class SpellGenerator:
 
     def set_system(self) -> None:
         """
-        Update everything according to selected system mode.  Swaps spell lists & re-initializes spell editing frame to
-        reflect elements that are relevant to current system.
+        Update everything according to selected system mode.  Swaps spell lists & swaps in the spell editing frame for
+        the current system, building it the first time that system is selected.
         """
-        self.spell_list_label.configure(text=self.system_mode.get() + " Spells")
-        self.spell_lb.delete(0, END)
-        for spell in self.spell_list[self.system_mode.get()]:
-            self.spell_lb.insert(END, spell.fields['name'])
-        self.spell_editor.destroy()
-        self.spell_editor.__init__(master=self.win, generator=self)
+        mode = self.system_mode.get()
+        self.spell_list_label.configure(text=mode + " Spells")
+        self.refresh_spell_lb()
+        self.spell_editor.pack_forget()
+        if mode not in self.spell_editors:
+            self.spell_editors[mode] = SpellEditor(master=self.win, generator=self)
+        self.spell_editor = self.spell_editors[mode]
         self.spell_editor.pack(side=RIGHT, fill=BOTH, expand=True)
-        self.default_system = self.system_mode.get()
+        self.default_system = mode
 
     def get_system(self) -> str:
         return self.system_mode.get()
 
+    def refresh_spell_lb(self) -> None:
+        """
+        Repopulate the spell Listbox from the current system's spell list.  All names are inserted with a single
+        variadic insert() call, i.e., one round-trip to Tk rather than one per spell.
+        """
+        self.spell_lb.delete(0, END)
+        names = [spell.fields['name'] for spell in self.spell_list[self.system_mode.get()]]
+        if len(names) > 0:
+            self.spell_lb.insert(END, *names)
+
+    def index_spells(self, mode: str) -> None:
+        """
+        Rebuild the name -> Spell lookup used for duplicate detection for the given system mode.  Where a name repeats,
+        the first spell with that name is kept, as in load_spell_lst().
+        """
+        spell_index = {}
+        for spell in self.spell_list[mode]:
+            spell_index.setdefault(spell.fields['name'], spell)
+        self.spell_index[mode] = spell_index
+
     def add_spell(self, spell: Spell) -> None:
-        for s in self.spell_list[self.system_mode.get()]:
-            if s.fields['name'] == spell.fields['name']:
-                answer = messagebox.askyesno("Duplicate spell", "Spell already exists in list.  Overwrite?")
-                if answer:
-                    self.spell_list[self.system_mode.get()].remove(s)
-                    i = self.spell_lb.get(0, END).index(s.fields['name'])
+        mode = self.system_mode.get()
+        spells = self.spell_list[mode]
+        spell_index = self.spell_index[mode]
+        existing = spell_index.get(spell.fields['name'])
+        if existing is not None:
+            answer = messagebox.askyesno("Duplicate spell", "Spell already exists in list.  Overwrite?")
+            if not answer:
+                return
+            # The listbox mirrors spell_list entry for entry, so the same position is removed from both
+            for i, s in enumerate(spells):
+                if s is existing:
+                    spells.pop(i)
                     self.spell_lb.delete(i)
                     break
-                else:
-                    return
 
-        self.spell_list[self.system_mode.get()].append(spell)
+        spells.append(spell)
+        spell_index[spell.fields['name']] = spell
         self.spell_lb.insert(END, spell.fields['name'])
 
     def remove_spell(self) -> None:
@@ -502,7 +533,11 @@ class SpellGenerator:
         except IndexError:
             messagebox.showerror("No spell selected", "Please select a spell from the list to remove.")
             return
-        self.spell_list[self.system_mode.get()].pop(index)
+        mode = self.system_mode.get()
+        spell = self.spell_list[mode].pop(index)
+        if self.spell_index[mode].get(spell.fields['name']) is spell:
+            # Another spell with the same name may still be in the list (e.g., loaded from a .lst repeating a name)
+            self.index_spells(mode)
         self.spell_lb.delete(index)
 
     def edit_spell(self) -> None:
@@ -528,7 +563,9 @@ class SpellGenerator:
 
         Calls generate_spell_lst() and generate_pcc_file() to actually write to the respective files.
         """
-        if len(self.spell_list[self.system_mode.get()]) == 0:
+        mode = self.system_mode.get()
+        spells = self.spell_list[mode]
+        if len(spells) == 0:
             messagebox.showerror("No spells defined", "No spells to save to a .lst file.  " +
                                  "Load and/or add spells first.")
             return
@@ -540,33 +577,33 @@ class SpellGenerator:
             if not filename.lower().endswith(".lst"):
                 filename = filename + ".lst"
             # Check to see if trying to overwrite a .lst file that wasn't generated by this tool, possibly wrecking it
-            if os.path.dirname(filename).count("/data") == 0:
+            if "/data" not in os.path.dirname(filename):
                 answer = messagebox.askokcancel("Warning", "It doesn't look like this is a valid subdirectory under " +
                                                 "the PCGen 'data' folder.  PCGen will not be able to find/load " +
                                                 "sources from other locations.  Continue?")
                 if not answer:
                     return
-            if os.path.isfile(filename):
+            if filename not in self.saved_lst_files and os.path.isfile(filename):
                 with open(filename, "r") as f:
-                    header = f.readline()
-                    while header.startswith("#"):
-                        header = f.readline()
-                if header.upper().count("HOMEBREW") == 0 and header.upper().count("MPC") == 0:
+                    header = next((line for line in f if not line.startswith("#")), "")
+                header = header.upper()
+                if "HOMEBREW" not in header and "MPC" not in header:
                     answer = messagebox.askokcancel("Warning", "It looks like this .lst file you're about to " +
                                                     "overwrite was not generated by this tool. Overwriting existing " +
                                                     "spell .lsts from other sources may cause them to stop " +
                                                     "functioning properly.  Continue?")
                     if not answer:
                         return
-            self.generate_spell_lst(filename=filename, spells=self.spell_list[self.system_mode.get()],
-                                    mods=self.mod_list, mode=self.system_mode.get())
+            self.generate_spell_lst(filename=filename, spells=spells, mods=self.mod_list, mode=mode)
+            self.saved_lst_files.add(filename)
             self.default_directory = os.path.dirname(filename)
             messagebox.showinfo("Success", "Saved spells to file: " + filename)
-            contents = os.listdir(self.default_directory)
             pcc_file = ""
-            for entry in contents:
-                if entry.endswith(".pcc"):
-                    pcc_file = os.path.join(self.default_directory, entry)
+            with os.scandir(self.default_directory) as contents:
+                for entry in contents:
+                    if entry.name.endswith(".pcc") and entry.is_file():
+                        pcc_file = entry.path
+                        break
             if pcc_file == "":
                 answer = messagebox.askyesno("No .pcc file found.", "Would you like to create a new .pcc file for " +
                                              "PCGen to be able to import your .lst as part of a new source?")
@@ -600,28 +637,23 @@ class SpellGenerator:
         try:
             if not pcc_file.endswith(".pcc"):
                 pcc_file = pcc_file.strip() + ".pcc"
+            pcc_title = os.path.basename(pcc_file).split(".")[0].title()
+            (game_mode, source_type) = PCC_GAME_MODES[self.system_mode.get()]
+            lines = ["CAMPAIGN:" + pcc_title,
+                     "GAMEMODE:" + game_mode,
+                     "TYPE:Homebrew." + source_type,
+                     "BOOKTYPE:Supplement",
+                     "PUBNAMELONG:Homebrew",
+                     "PUBNAMESHORT:Homebrew",
+                     "SOURCELONG:" + pcc_title,
+                     "SOURCESHORT:Homebrew",
+                     "RANK:9",
+                     "DESC:Homebrew content generated by PCGen Homebrew Spell LST Generator",
+                     "",
+                     "SPELL:" + os.path.basename(spell_lst_file)]
             with open(pcc_file, "w") as f:
-                pcc_name = os.path.basename(pcc_file).split(".")[0]
-                f.write("CAMPAIGN:" + pcc_name.title() + "\n")
-                if self.system_mode.get() == "Pathfinder 1e":
-                    f.write("GAMEMODE:Pathfinder\n")
-                    f.write("TYPE:Homebrew.PathfinderHomebrew\n")
-                elif self.system_mode.get() == "D&D 3.5e":
-                    f.write("GAMEMODE:35e\n")
-                    f.write("TYPE:Homebrew.35Homebrew\n")
-                elif self.system_mode.get() == "D&D 5e":
-                    f.write("GAMEMODE:5e\n")
-                    f.write("TYPE:Homebrew.5eHomebrew\n")
-
-                f.write("BOOKTYPE:Supplement\n")
-                f.write("PUBNAMELONG:Homebrew\n")
-                f.write("PUBNAMESHORT:Homebrew\n")
-                f.write("SOURCELONG:" + pcc_name.title() + "\n")
-                f.write("SOURCESHORT:Homebrew\n")
-                f.write("RANK:9\n")
-                f.write("DESC:Homebrew content generated by PCGen Homebrew Spell LST Generator\n\n")
-                f.write("SPELL:" + os.path.basename(spell_lst_file))
-                return True
+                f.write("\n".join(lines))
+            return True
         except Exception as e:
             messagebox.showerror("Error generating .pcc file.", str(e))
             print(e)
@@ -635,20 +667,16 @@ class SpellGenerator:
         :param pcc_file: Fully-qualified path to .pcc file to check
         :param lst_file: Fully-qualified path to .lst file to check .pcc file for a reference to
         """
+        lst_name = os.path.basename(lst_file)
         with open(pcc_file, "r") as f:
-            lines = f.readlines()
-        spell_lst_found = False
-        for line in lines:
-            if line.startswith("SPELL:"):
-                if line.count(os.path.basename(lst_file)) > 0:
-                    spell_lst_found = True
+            spell_lst_found = any(line.startswith("SPELL:") and lst_name in line for line in f)
         if not spell_lst_found:
             answer = messagebox.askyesno(".lst file not loaded in .pcc", "The .pcc file in this folder does " +
                                          "not appear to load your .lst file.  Add it to the .pcc file?")
             if answer:
                 try:
                     with open(pcc_file, "a") as f:
-                        f.write("\nSPELL:" + os.path.basename(lst_file))
+                        f.write("\nSPELL:" + lst_name)
                 except Exception as e:
                     messagebox.showerror("Error updating " + os.path.basename(pcc_file), str(e))
                     print(e)
@@ -664,15 +692,12 @@ class SpellGenerator:
         filename = filedialog.askopenfilename(initialdir=self.default_directory, title="Select a file to open",
                                               filetypes=(("PCGen LST Files", "*.lst"), ("All Files", "*.*")))
         if filename is not None and len(str(filename)) > 0:
-            self.spell_list[self.system_mode.get()].clear()
+            mode = self.system_mode.get()
+            self.spell_list[mode].clear()
             self.mod_list.clear()
-            (self.header, self.spell_list[self.system_mode.get()], self.mod_list) = self.load_spell_lst(
-                filename=filename)
-            self.spell_lb.delete(0, 'end')
-            index = 0
-            for spell in self.spell_list[self.system_mode.get()]:
-                self.spell_lb.insert(index, spell.fields['name'])
-                index = index + 1
+            (self.header, self.spell_list[mode], self.mod_list) = self.load_spell_lst(filename=filename)
+            self.index_spells(mode)
+            self.refresh_spell_lb()
             self.default_directory = os.path.dirname(filename)
             messagebox.showinfo("Success", "Loaded spells from file: " + filename)
 
@@ -706,8 +731,7 @@ class SpellGenerator:
         directory when loading/saving .lst files.
         """
         try:
-            with open(self.config_file, "r") as f:
-                lines = f.readlines()
+            f = open(self.config_file, "r")
         except FileNotFoundError:
             self.default_directory = self.find_pcgen_directory()
             mode_dialog = Tk()
@@ -728,12 +752,15 @@ class SpellGenerator:
             # mode_dialog.destroy()
             return
 
-        for line in lines:
-            line = line.strip()
-            if line.startswith("DEFAULTDIRECTORY"):
-                self.default_directory = line.split("=", maxsplit=1)[1]
-            elif line.startswith("DEFAULTSYSTEM"):
-                self.default_system = line.split("=", maxsplit=1)[1]
+        with f:
+            for line in f:
+                (key, separator, value) = line.strip().partition("=")
+                if not separator:
+                    continue
+                if key == "DEFAULTDIRECTORY":
+                    self.default_directory = value
+                elif key == "DEFAULTSYSTEM":
+                    self.default_system = value
 
     @staticmethod
     def find_pcgen_directory() -> str:
@@ -744,22 +771,19 @@ class SpellGenerator:
         pcgen_folder_found = False
         path = os.path.expanduser('~')
         try:
-            contents = os.listdir(path)
-            if contents.count("AppData") > 0:
-                path = os.path.join(path, "AppData")
-                contents = os.listdir(path)
-                if contents.count("Local") > 0:
-                    path = os.path.join(path, "Local")
-                    contents = os.listdir(path)
-                    if contents.count("PCGen") > 0:
-                        path = os.path.join(path, "PCGen")
-                        contents = os.listdir(path)
-                        for entry in contents:
-                            candidate = os.path.join(path, entry)
-                            if os.path.isdir(candidate) and entry.startswith("6.") and entry.count("Save") == 0:
-                                path = os.path.join(candidate, "data")
-                                pcgen_folder_found = True
-                                break
+            # Probe each known folder directly; only the versioned PCGen folder needs a directory listing
+            for folder in ("AppData", "Local", "PCGen"):
+                candidate = os.path.join(path, folder)
+                if not os.path.isdir(candidate):
+                    break
+                path = candidate
+            else:
+                with os.scandir(path) as contents:
+                    for entry in contents:
+                        if entry.is_dir() and entry.name.startswith("6.") and "Save" not in entry.name:
+                            path = os.path.join(entry.path, "data")
+                            pcgen_folder_found = True
+                            break
         except Exception as e:
             print("Could not find PCGen directory.  Returning current working directory.")
             print(e)
@@ -780,156 +804,135 @@ class SpellGenerator:
         :param filename: String containing fully-qualified path of .lst file to load and parse
         :returns: A tuple containing (header: str, spells: list[Spell], mods: list[str])
         """
-        with open(filename, "r") as f:
-            lines = f.readlines()
-
         spells = []
+        # Lookup of already-parsed spells by name, so .MODs can be matched to their spell without a scan of the list.
+        #  Only the first spell with a given name is kept, as that is the one a .MOD was applied to previously.
+        spell_by_name = {}
+        # .MOD lines are set aside and applied once every spell in the file has been parsed
+        mod_lines = []
         mods = []
         header = ""
-        for line in lines:
-            line = line.strip()
-            if line.count("SOURCELONG") > 0:
-                header = line
-            elif line.count(".MOD") > 0:
-                # This program mostly ignores .MODs and just stores them to a list for preservation, but the 5e SRD
-                #  spells .lst seems to put all casting class data in .MODs, so I try to parse that here to assign
-                #  classes (spell lists) to spells.
-                tokens = list(filter(None, line.split("\t")))
-                name = tokens[0]
-                name = name.replace(".MOD", "")
-                for spell in spells:
-                    if spell.fields['name'] == name:
-                        for token in tokens:
-                            if token.startswith("CLASSES:") and not token.endswith("CLASSES:"):
-                                class_tokens = token.split(":", maxsplit=1)
-                                class_string = class_tokens[1]
-                                if class_string.count("[") > 0 and class_string.count("]") > 0:
-                                    start = class_string.index("[")
-                                    end = class_string.index("]")
-                                    spell.fields['class_suffix'] += class_string[start:end + 1]
-                                    class_string = class_string[0:start]
-                                class_tokens = class_string.split("|")
-                                for level_group in class_tokens:
-                                    class_string = level_group.split("=", maxsplit=1)[0]
-                                    level = int(level_group.split("=", maxsplit=1)[1])
-                                    class_list = class_string.split(",")
-                                    for caster in class_list:
-                                        spell.classes[level].append(caster)
-                                tokens.remove(token)
-                if len(tokens) > 1:
-                    line = "\t".join(tokens)
-                    mods.append(line)
-            elif len(line) > 0 and line[0] != "#":
-                spell_dict = {}
-                tokens = list(filter(None, line.split("\t")))
-                spell_dict['name'] = tokens.pop(0)
-                spell_dict['classes'] = [[], [], [], [], [], [], [], [], [], []]
-                spell_dict['class_suffix'] = ""
-                spell_dict['verbal'] = False
-                spell_dict['somatic'] = False
-                spell_dict['material'] = False
-                spell_dict['focus'] = False
-                spell_dict['divine_focus'] = False
-                spell_dict['arcane'] = False
-                spell_dict['divine'] = False
-                spell_dict['psychic'] = False
-                spell_dict['school'] = ""
-                spell_dict['casting_time'] = ""
-                spell_dict['range'] = ""
-                spell_dict['duration'] = ""
-                spell_dict['desc'] = ""
-                spell_dict['sr'] = ""
-                spell_dict['save'] = ""
-                spell_dict['target'] = ""
-                spell_dict['descriptors'] = []
-                spell_dict['subschool'] = ""
-                spell_dict['material_desc'] = ""
-                spell_dict['other_fields'] = []
+        with open(filename, "r") as f:
+            for line in f:
+                line = line.strip()
+                if len(line) == 0 or line[0] == "#":
+                    continue
+                # Classify each line by its first token only: header lines start with SOURCE* tags and .MODs always
+                #  carry the .MOD suffix on the spell name, so the rest of the line never needs scanning here.
+                first_token = line.partition("\t")[0]
+                if first_token.startswith("SOURCE") and "SOURCELONG" in line:
+                    header = line
+                elif ".MOD" in first_token:
+                    mod_lines.append(line)
+                else:
+                    spell = SpellGenerator.parse_spell_line(line)
+                    spells.append(spell)
+                    spell_by_name.setdefault(spell.fields['name'], spell)
+        for line in mod_lines:
+            # This program mostly ignores .MODs and just stores them to a list for preservation, but the 5e SRD
+            #  spells .lst seems to put all casting class data in .MODs, so I try to parse that here to assign
+            #  classes (spell lists) to spells.
+            tokens = [token for token in line.split("\t") if token]
+            name = tokens[0]
+            name = name.replace(".MOD", "")
+            spell = spell_by_name.get(name)
+            if spell is not None:
+                # Merged CLASSES tokens are dropped from the .MOD; everything else is kept to be written back out
+                kept_tokens = []
                 for token in tokens:
-                    token = token.strip()
-                    if token.startswith("TYPE:"):
-                        (spell_dict['arcane'], spell_dict['divine'], spell_dict['psychic']) = (False, False, False)
-                        if token.count("Arcane") > 0:
-                            spell_dict['arcane'] = True
-                        if token.count("Divine") > 0:
-                            spell_dict['divine'] = True
-                        if token.count("Psychic") > 0:
-                            spell_dict['psychic'] = True
-                    elif token.startswith("CLASSES:") and not token.endswith("CLASSES:"):
-                        class_tokens = token.split(":", maxsplit=1)
-                        class_string = class_tokens[1]
-                        if class_string.count("[") > 0 and class_string.count("]") > 0:
-                            start = class_string.index("[")
-                            end = class_string.index("]")
-                            spell_dict['class_suffix'] = class_string[start:end+1]
-                            class_string = class_string[0:start]
-                        class_tokens = class_string.split("|")
-                        for level_group in class_tokens:
-                            class_string = level_group.split("=", maxsplit=1)[0]
-                            level = int(level_group.split("=", maxsplit=1)[1])
-                            class_list = class_string.split(",")
-                            spell_dict['classes'][level] = class_list
-                    elif token.startswith("SCHOOL:"):
-                        spell_dict['school'] = token.split(":", maxsplit=1)[1]
-                    elif token.startswith("SUBSCHOOL:"):
-                        spell_dict['subschool'] = token.split(":", maxsplit=1)[1]
-                    elif token.startswith("CASTTIME:"):
-                        spell_dict['casting_time'] = token.split(":", maxsplit=1)[1]
-                    elif token.startswith("RANGE:"):
-                        spell_dict['range'] = token.split(":", maxsplit=1)[1]
-                    elif token.startswith("DURATION:"):
-                        spell_dict['duration'] = token.split(":", maxsplit=1)[1]
-                    elif token.startswith("TARGETAREA:"):
-                        spell_dict['target'] = token.split(":", maxsplit=1)[1]
-                    elif token.startswith("SAVEINFO:"):
-                        spell_dict['save'] = token.split(":", maxsplit=1)[1]
-                    elif token.startswith("SPELLRES:"):
-                        spell_dict['sr'] = token.split(":", maxsplit=1)[1]
-                    elif token.startswith("DESCRIPTOR:"):
-                        descriptor_string = token.split(":", maxsplit=1)[1]
-                        spell_dict['descriptors'] = descriptor_string.split("|")
-                    elif token.startswith("DESC:"):
-                        spell_dict['desc'] = token.split(":", maxsplit=1)[1]
-                    elif token.startswith("COMPS:"):
-                        comp_string = token.split(":", maxsplit=1)[1]
-                        if comp_string.count("(") > 0 and comp_string.count(")") > 0:
-                            start = comp_string.index("(")
-                            end = comp_string.index(")")
-                            spell_dict['material_desc'] = comp_string[start+1:end]
-                            comp_string = comp_string[0:start]
-                        comp_list = comp_string.split(",")
-                        for comp in comp_list:
-                            if comp.strip() == "V":
-                                spell_dict['verbal'] = True
-                            elif comp.strip() == "S":
-                                spell_dict['somatic'] = True
-                            elif comp.strip() == "M":
-                                spell_dict['material'] = True
-                            elif comp.strip() == "F":
-                                spell_dict['focus'] = True
-                            elif comp.strip() == "DF":
-                                spell_dict['divine_focus'] = True
-                            elif comp.strip() == "F/DF":
-                                spell_dict['focus'] = True
-                                spell_dict['divine_focus'] = True
-                    elif not token.endswith("CLASSES:"):
-                        spell_dict['other_fields'].append(token)
-                spells.append(Spell(name=spell_dict['name'], classes_by_level=spell_dict['classes'],
-                                    school=spell_dict['school'], casting_time=spell_dict['casting_time'],
-                                    spell_range=spell_dict['range'], duration=spell_dict['duration'],
-                                    desc=spell_dict['desc'],
-                                    arcane=spell_dict['arcane'], divine=spell_dict['divine'],
-                                    psychic=spell_dict['psychic'],
-                                    save=spell_dict['save'], sr=spell_dict['sr'], target=spell_dict['target'],
-                                    descriptors=spell_dict['descriptors'], subschool=spell_dict['subschool'],
-                                    verbal=spell_dict['verbal'], somatic=spell_dict['somatic'],
-                                    material=spell_dict['material'],
-                                    focus=spell_dict['focus'], divine_focus=spell_dict['divine_focus'],
-                                    material_desc=spell_dict['material_desc'],
-                                    class_suffix=spell_dict['class_suffix'],
-                                    other_fields=spell_dict['other_fields']))
+                    (tag, separator, class_string) = token.partition(":")
+                    if tag == "CLASSES" and len(class_string) > 0:
+                        (class_suffix, class_levels) = SpellGenerator.parse_classes(class_string)
+                        spell.fields['class_suffix'] += class_suffix
+                        for (level, class_list) in class_levels:
+                            spell.classes[level].extend(class_list)
+                    else:
+                        kept_tokens.append(token)
+                tokens = kept_tokens
+                spell.mark_dirty()
+            if len(tokens) > 1:
+                line = "\t".join(tokens)
+                mods.append(line)
         return (header, spells, mods)
 
+    @staticmethod
+    def parse_spell_line(line: str) -> Spell:
+        """
+        Parses a single spell line from a .lst file (i.e., not a header, comment or .MOD line) into a Spell.  Split out
+        of load_spell_lst() to keep the per-token parsing self-contained.
+
+        :param line: Stripped line from a .lst file, containing the spell name followed by tab-separated tokens
+        :returns: Spell populated from the line's tokens
+        """
+        tokens = [token for token in line.split("\t") if token]
+        # Keys are the Spell() argument names, so the parsed values can be passed straight to Spell
+        spell_dict = LST_SPELL_DEFAULTS.copy()
+        spell_dict['name'] = tokens.pop(0)
+        spell_dict['classes_by_level'] = [[], [], [], [], [], [], [], [], [], []]
+        spell_dict['descriptors'] = []
+        spell_dict['other_fields'] = []
+        for token in tokens:
+            token = token.strip()
+            (tag, separator, value) = token.partition(":")
+            if not separator:
+                spell_dict['other_fields'].append(token)
+            elif tag in LST_TEXT_TAGS:
+                spell_dict[LST_TEXT_TAGS[tag]] = value
+            elif tag == "TYPE":
+                (spell_dict['arcane'], spell_dict['divine'], spell_dict['psychic']) = (False, False, False)
+                if "Arcane" in value:
+                    spell_dict['arcane'] = True
+                if "Divine" in value:
+                    spell_dict['divine'] = True
+                if "Psychic" in value:
+                    spell_dict['psychic'] = True
+            elif tag == "CLASSES" and len(value) > 0:
+                (class_suffix, class_levels) = SpellGenerator.parse_classes(value)
+                if len(class_suffix) > 0:
+                    spell_dict['class_suffix'] = class_suffix
+                for (level, class_list) in class_levels:
+                    spell_dict['classes_by_level'][level] = class_list
+            elif tag == "DESCRIPTOR":
+                spell_dict['descriptors'] = value.split("|")
+            elif tag == "COMPS":
+                comp_string = value
+                start = comp_string.find("(")
+                end = comp_string.find(")", start + 1)
+                if start != -1 and end != -1:
+                    spell_dict['material_desc'] = comp_string[start+1:end]
+                    comp_string = comp_string[0:start]
+                comp_list = comp_string.split(",")
+                for comp in comp_list:
+                    for flag in LST_COMP_FLAGS.get(comp.strip(), ()):
+                        spell_dict[flag] = True
+            elif not token.endswith("CLASSES:"):
+                spell_dict['other_fields'].append(token)
+        return Spell(**spell_dict)
+
+    @staticmethod
+    def parse_classes(class_string: str) -> tuple:
+        """
+        Parses the value of a CLASSES token (e.g., "Cleric,Druid=1|Wizard=2[PRExxx]") into casters per spell level.
+        Shared by spell lines and the .MODs that add classes to them.
+
+        :param class_string: Text of a CLASSES token following the "CLASSES:" tag
+        :returns: A tuple containing (class_suffix: str, class_levels: list[tuple[int, list[str]]]), where class_suffix
+                  is any bracketed text following the class list (or "" if none)
+        """
+        class_suffix = ""
+        # Find each bracket once and reuse the positions, rather than counting and then indexing again.  The closing
+        #  bracket is only searched for after the opening one.
+        start = class_string.find("[")
+        end = class_string.find("]", start + 1)
+        if start != -1 and end != -1:
+            class_suffix = class_string[start:end + 1]
+            class_string = class_string[0:start]
+        class_levels = []
+        for level_group in class_string.split("|"):
+            (casters, separator, level_string) = level_group.partition("=")
+            class_levels.append((int(level_string), [sys.intern(caster) for caster in casters.split(",")]))
+        return (class_suffix, class_levels)
+
     @staticmethod
     def generate_spell_lst(filename: str, spells: list, mods: list = (),
                            header: str = "SOURCELONG:Homebrew\tSOURCESHORT:Homebrew\tSOURCEWEB:None\t#\tSOURCEDATE:" +
@@ -946,18 +949,18 @@ class SpellGenerator:
                     specifying source as "Homebrew" with current date.
         :param mode: String defining what game/system mode context to use when writing spells to a .lst
         """
+        lines = ["# Generated by PCGen Spell LST File Generator " +
+                 "(https://github.com/Tamdrik/PCGen-Spell-LST-File-Generator)",
+                 header,
+                 ""]
+        for spell in spells:
+            spell.mode = mode
+            lines.append(str(spell))
+        lines.append("")
+        lines.append("# BEGIN MODS")
+        lines.extend(mods)
         with open(filename, "w") as f:
-            f.write("# Generated by PCGen Spell LST File Generator " +
-                    "(https://github.com/Tamdrik/PCGen-Spell-LST-File-Generator)\n")
-            f.write(header + "\n")
-            f.write("\n")
-            for spell in spells:
-                spell.mode = mode
-                f.write(str(spell) + "\n")
-            f.write("\n")
-            f.write("# BEGIN MODS\n")
-            for mod in mods:
-                f.write(mod + "\n")
+            f.write("\n".join(lines) + "\n")
 
 
 class SpellEditor(Frame):
@@ -990,16 +993,14 @@ class SpellEditor(Frame):
         spell_labels['name'].pack(side=LEFT)
         self.spell_fields['name'] = Entry(spell_edit_subframes[row], width=35, font='bold')
         self.spell_fields['name'].pack(side=LEFT, padx=15, pady=15)
-        ToolTip(self.spell_fields['name'],
-                msg="Recommend avoiding commas or other special characters besides\n" +
-                    "hyphens, underscores, apostrophes, or parentheses to avoid potential issues (-_')")
+        self.add_tooltip(self.spell_fields['name'],
+                         msg="Recommend avoiding commas or other special characters besides\n" +
+                             "hyphens, underscores, apostrophes, or parentheses to avoid potential issues (-_')")
 
         spell_labels['school'] = Label(spell_edit_subframes[row], text="School")
         spell_labels['school'].pack(side=LEFT)
-        self.schools = ["Abjuration", "Conjuration", "Divination", "Enchantment", "Evocation", "Illusion", "Necromancy",
-                        "Transmutation"]
-        if self.mode != "D&D 5e":
-            self.schools.append("Universal")
+        # SUBSCHOOLS is keyed by each system's schools, in dropdown order (5e has no Universal school)
+        self.schools = tuple(SUBSCHOOLS[self.mode])
         self.selected_school = StringVar(self.master)
         self.selected_school.set("Abjuration")
         self.spell_school_dropdown = OptionMenu(spell_edit_subframes[row], self.selected_school, *self.schools,
@@ -1047,35 +1048,12 @@ class SpellEditor(Frame):
             self.component_cb['material'].configure(command=self.update_material_desc_field)
             self.spell_fields['material_desc'] = Entry(self.components_frame, width=35, state=DISABLED)
             self.spell_fields['material_desc'].pack(side=LEFT)
-            ToolTip(self.spell_fields['material_desc'], "Additional material component description, particularly if " +
-                                                        "costly.\nExamples:\nruby dust worth 1,500gp\n" +
-                                                        "incense and powdered diamond worth 200gp, which the spell " +
-                                                        "consumes")
+            self.add_tooltip(self.spell_fields['material_desc'],
+                             msg="Additional material component description, particularly if costly.\nExamples:\n" +
+                                 "ruby dust worth 1,500gp\n" +
+                                 "incense and powdered diamond worth 200gp, which the spell consumes")
 
-        self.subschools = {}
-        if self.mode == "D&D 5e":
-            for school in self.schools:
-                self.subschools[school] = ["", "Ritual"]
-        elif self.mode == "Pathfinder 1e":
-            self.subschools['Abjuration'] = [""]
-            self.subschools['Conjuration'] = ["", "Calling", "Creation", "Healing", "Summoning", "Teleportation"]
-            self.subschools['Divination'] = ["", "Scrying"]
-            self.subschools['Enchantment'] = ["", "Charm", "Compulsion"]
-            self.subschools['Evocation'] = [""]
-            self.subschools['Illusion'] = ["", "Figment", "Glamer", "Pattern", "Phantasm", "Shadow"]
-            self.subschools['Necromancy'] = [""]
-            self.subschools['Transmutation'] = ["", "Polymorph"]
-            self.subschools['Universal'] = [""]
-        elif self.mode == "D&D 3.5e":
-            self.subschools['Abjuration'] = [""]
-            self.subschools['Conjuration'] = ["", "Calling", "Creation", "Healing", "Summoning"]
-            self.subschools['Divination'] = ["", "Scrying"]
-            self.subschools['Enchantment'] = ["", "Charm", "Compulsion"]
-            self.subschools['Evocation'] = [""]
-            self.subschools['Illusion'] = ["", "Figment", "Glamer", "Pattern", "Phantasm", "Shadow"]
-            self.subschools['Necromancy'] = [""]
-            self.subschools['Transmutation'] = [""]
-            self.subschools['Universal'] = [""]
+        self.subschools = SUBSCHOOLS[self.mode]
 
         self.selected_subschool = StringVar()
         self.selected_subschool.set("")
@@ -1087,10 +1065,13 @@ class SpellEditor(Frame):
         spell_labels['subschool'].pack(side=LEFT, padx=(15, 1))
         self.subschool_dropdown = OptionMenu(spell_edit_subframes[row], self.selected_subschool,
                                              *self.subschool_choices)
+        # Subschools currently listed in the dropdown's menu, so it is only rebuilt when the choices actually change
+        self.subschool_menu_choices = self.subschool_choices
         self.subschool_dropdown.pack(side=LEFT, padx=(15, 1))
         if self.mode != "D&D 5e":
-            ToolTip(self.subschool_dropdown, msg="Note: Each school has its own different valid subschools, and some " +
-                                                 "schools do not have any.")
+            self.add_tooltip(self.subschool_dropdown,
+                             msg="Note: Each school has its own different valid subschools, and some " +
+                                 "schools do not have any.")
 
         row = row + 1
         ##### Class/level #####
@@ -1111,46 +1092,31 @@ class SpellEditor(Frame):
         classes_top_subframe.pack(side=TOP, fill=Y, expand=True)
         classes_bottom_subframe = Frame(classes_frame)
         classes_bottom_subframe.pack(side=TOP)
-        self.caster_type = {}
-        if self.mode == "Pathfinder 1e":
-            self.caster_type['arcane'] = ("Alchemist", "Bard", "Bloodrager", "Magus", "Summoner", "Witch", "Wizard")
-            self.caster_type['divine'] = ("Antipaladin", "Cleric", "Druid", "Hunter", "Inquisitor", "Paladin", "Ranger",
-                                          "Shaman")
-            self.caster_type['psychic'] = ("Medium", "Mesmerist", "Occultist", "Psychic", "Spiritualist")
-        elif self.mode == "D&D 3.5e":
-            self.caster_type['arcane'] = ("Bard", "Wizard")
-            self.caster_type['divine'] = ("Blackguard", "Cleric", "Druid", "Paladin")
-            #self.caster_type['psionic'] = ("Psion", "Wilder", "Psychic Warrior")
-        elif self.mode == "D&D 5e":
-            self.caster_type['arcane'] = ("Artificer", "Bard", "Sorcerer", "Warlock", "Warlock Book of Shadows",
-                                          "Wizard")
-            self.caster_type['divine'] = ("Cleric", "Druid", "Paladin", "Ranger")
-
-        self.classes = []
-        for spell_type in self.caster_type.keys():
-            for caster in self.caster_type[spell_type]:
-                self.classes.append(caster)
+        self.caster_type = CASTER_TYPES[self.mode]
+        self.classes = CASTER_CLASSES[self.mode]
+        # Reverse lookup of spell type (arcane/divine/psychic) by casting class, for the add/remove class buttons
+        self.class_type = CLASS_SPELL_TYPES[self.mode]
 
         self.selected_class = StringVar(self.master)
         self.selected_class.set("Wizard")
         self.classes_dropdown = OptionMenu(classes_top_subframe, self.selected_class, *self.classes)
         self.classes_dropdown.pack(side=LEFT)
         if self.mode == "D&D 5e":
-            ToolTip(self.classes_dropdown,
-                    msg="Some classes cast spells from other spell lists, e.g., a Monochromancer casts from the " +
-                        "Warlock and Cleric lists, so there is no separate Monochromancer option.")
+            self.add_tooltip(self.classes_dropdown,
+                             msg="Some classes cast spells from other spell lists, e.g., a Monochromancer casts " +
+                                 "from the Warlock and Cleric lists, so there is no separate Monochromancer option.")
         elif self.mode == "Pathfinder 1e":
-            ToolTip(self.classes_dropdown,
-                    msg="Some classes share spell lists, e.g., Sorcerers and Arcanists use the Wizard list.\n" +
-                        "Unchained Summoner is not supported by this tool.")
+            self.add_tooltip(self.classes_dropdown,
+                             msg="Some classes share spell lists, e.g., Sorcerers and Arcanists use the Wizard " +
+                                 "list.\nUnchained Summoner is not supported by this tool.")
         elif self.mode == "D&D 3.5e":
-            ToolTip(self.classes_dropdown,
-                    msg="Some classes share spell lists, e.g., Sorcerers use the Wizard list.\n")
+            self.add_tooltip(self.classes_dropdown,
+                             msg="Some classes share spell lists, e.g., Sorcerers use the Wizard list.\n")
 
         self.spell_level_spinbox = Spinbox(classes_top_subframe, from_=0, to=9, width=3)
         self.spell_level_spinbox.pack(side=LEFT)
-        ToolTip(self.spell_level_spinbox,
-                msg="Spell level when cast by this class")
+        self.add_tooltip(self.spell_level_spinbox,
+                         msg="Spell level when cast by this class")
 
         self.spell_buttons['remove_class'] = Button(classes_bottom_subframe, text="Remove", width=10,
                                                     command=self.remove_class)
@@ -1166,17 +1132,7 @@ class SpellEditor(Frame):
             self.descriptors_lb = Listbox(descriptors_frame, height=4, width=20)
             self.descriptors_lb.pack(side=LEFT)
             self.selected_descriptor = StringVar()
-            if self.mode == "Pathfinder 1e":
-                self.descriptors = ["Acid", "Air", "Chaotic", "Cold", "Curse", "Darkness", "Death", "Disease",
-                                    "Draconic", "Earth", "Electricity", "Emotion", "Evil", "Fear", "Fire", "Force",
-                                    "Good", "Language-Dependent", "Lawful", "Light", "Meditative", "Mind-Affecting",
-                                    "Pain", "Poison", "Shadow", "Sonic", "Water"]
-            else:
-                self.descriptors = ["Acid", "Air", "Chaos", "Chaotic", "Cold", "Compulsion", "Creation", "Darkness",
-                                    "Death", "Earth", "Ectomancy", "Electricity", "Evil", "Fear", "Fire",
-                                    "Fire or Cold", "Force", "Glamer", "Good", "Good or Evil", "Ice", "Incarnum",
-                                    "Investiture", "Language-Dependent", "Law", "Lawful", "Light", "Mind-Affecting",
-                                    "Mindset", "Pattern", "Shadow", "Summoning", "Teleportation", "Water"]
+            self.descriptors = DESCRIPTORS[self.mode]
 
             self.descriptor_dropdown = OptionMenu(descriptors_frame, self.selected_descriptor, *self.descriptors)
             self.descriptor_dropdown.pack(side=TOP, fill=X)
@@ -1195,12 +1151,12 @@ class SpellEditor(Frame):
 
         if self.mode == "D&D 5e":
             self.spell_fields['casting_time'].insert(0, "1 action")
-            ToolTip(self.spell_fields['casting_time'],
-                    msg="Examples:\n1 action\n1 bonus action\n1 reaction\n8 hours")
+            self.add_tooltip(self.spell_fields['casting_time'],
+                             msg="Examples:\n1 action\n1 bonus action\n1 reaction\n8 hours")
         else:
             self.spell_fields['casting_time'].insert(0, "1 standard action")
-            ToolTip(self.spell_fields['casting_time'],
-                    msg="Examples:\n1 standard action\n1 round\n10 minutes\n1 immediate action")
+            self.add_tooltip(self.spell_fields['casting_time'],
+                             msg="Examples:\n1 standard action\n1 round\n10 minutes\n1 immediate action")
 
         spell_labels['range'] = Label(spell_edit_subframes[row], text="Range")
         spell_labels['range'].pack(side=LEFT, padx=(15, 1))
@@ -1208,20 +1164,22 @@ class SpellEditor(Frame):
         self.spell_fields['range'].pack(side=LEFT)
 
         if self.mode == "D&D 5e":
-            ToolTip(self.spell_fields['range'], msg="Examples:\nSelf\n30 feet\nTouch\nSelf (10-foot radius)")
+            self.add_tooltip(self.spell_fields['range'], msg="Examples:\nSelf\n30 feet\nTouch\nSelf (10-foot radius)")
         else:
-            ToolTip(self.spell_fields['range'], msg="Examples:\nClose\n30 ft\nTouch\nPersonal")
+            self.add_tooltip(self.spell_fields['range'], msg="Examples:\nClose\n30 ft\nTouch\nPersonal")
 
         spell_labels['duration'] = Label(spell_edit_subframes[row], text="Duration")
         spell_labels['duration'].pack(side=LEFT, padx=(15, 1))
         self.spell_fields['duration'] = Entry(spell_edit_subframes[row], width=30)
         self.spell_fields['duration'].pack(side=LEFT)
         if self.mode == "D&D 5e":
-            ToolTip(self.spell_fields['duration'], msg="Examples:\nInstantaneous\n1 round\nUntil dispelled\n8 hours\n" +
-                                                       "Concentration, up to 10 minutes")
+            self.add_tooltip(self.spell_fields['duration'],
+                             msg="Examples:\nInstantaneous\n1 round\nUntil dispelled\n8 hours\n" +
+                                 "Concentration, up to 10 minutes")
         else:
-            ToolTip(self.spell_fields['duration'], msg="Examples:\ninstantaneous\n1 round\n(CASTERLEVEL) rounds [D]\n" +
-                                                       "(CASTERLEVEL*10) minutes\npermanent")
+            self.add_tooltip(self.spell_fields['duration'],
+                             msg="Examples:\ninstantaneous\n1 round\n(CASTERLEVEL) rounds [D]\n" +
+                                 "(CASTERLEVEL*10) minutes\npermanent")
 
         row = row + 1
         if self.mode != "D&D 5e":
@@ -1229,9 +1187,9 @@ class SpellEditor(Frame):
             spell_labels['target'].pack(side=LEFT)
             self.spell_fields['target'] = Entry(spell_edit_subframes[row], width=50)
             self.spell_fields['target'].pack(side=LEFT)
-            ToolTip(self.spell_fields['target'],
-                    msg="Examples:\nYou\nOne creature or unattended object\n" +
-                        "(CASTERLEVEL) creatures, no two of which may be more than 30 ft apart")
+            self.add_tooltip(self.spell_fields['target'],
+                             msg="Examples:\nYou\nOne creature or unattended object\n" +
+                                 "(CASTERLEVEL) creatures, no two of which may be more than 30 ft apart")
 
         spell_labels['save'] = Label(spell_edit_subframes[row], text="Save")
         spell_labels['save'].pack(side=LEFT, padx=(15, 1))
@@ -1239,14 +1197,14 @@ class SpellEditor(Frame):
         self.spell_fields['save'].pack(side=LEFT)
 
         if self.mode == "D&D 5e":
-            ToolTip(self.spell_fields['save'],
-                    msg="Can be blank for some spells, e.g., personal buffs.\nExamples:\nNone\nDexterity\n" +
-                        "Wisdom")
+            self.add_tooltip(self.spell_fields['save'],
+                             msg="Can be blank for some spells, e.g., personal buffs.\nExamples:\nNone\nDexterity\n" +
+                                 "Wisdom")
 
         else:
-            ToolTip(self.spell_fields['save'],
-                    msg="Can be blank for some spells, e.g., personal buffs.\nExamples:\nNone\nFortitude negates\n" +
-                        "Will negates (harmless)\nReflex partial; see text")
+            self.add_tooltip(self.spell_fields['save'],
+                             msg="Can be blank for some spells, e.g., personal buffs.\nExamples:\nNone\n" +
+                                 "Fortitude negates\nWill negates (harmless)\nReflex partial; see text")
             self.sr_frame = LabelFrame(spell_edit_subframes[row], text="SR?")
             self.sr_frame.pack(side=LEFT, padx=(15, 10))
             self.sr_values = ("Yes", "Yes (Harmless)", "No", "None")
@@ -1271,21 +1229,35 @@ class SpellEditor(Frame):
         other_fields_frame.pack(fill=BOTH, expand=True)
         self.spell_fields['other'] = Text(other_fields_frame, height=2, wrap=WORD)
         self.spell_fields['other'].pack(side=LEFT, fill=X, expand=True)
-        ToolTip(self.spell_fields['other'],
-                msg="Other tab-separated tokens not explicitly supported by this tool. Edit with caution.\n" +
-                    "Examples:\nSOURCEPAGE:p.50\nFACTSET:Deity|Asmodeus\nTEMPBONUS [various]\n" +
-                    "FACT:CompMaterial|(500gp of diamond dust)")
+        self.add_tooltip(self.spell_fields['other'],
+                         msg="Other tab-separated tokens not explicitly supported by this tool. Edit with caution.\n" +
+                             "Examples:\nSOURCEPAGE:p.50\nFACTSET:Deity|Asmodeus\nTEMPBONUS [various]\n" +
+                             "FACT:CompMaterial|(500gp of diamond dust)")
 
         row = row + 1
         self.spell_buttons['add_spell'] = Button(spell_edit_subframes[row], text="Add Spell", command=self.add_spell,
                                                  font=('bold', 14), width=20)
         self.spell_buttons['add_spell'].pack(side=BOTTOM, pady=10)
 
+    @staticmethod
+    def add_tooltip(widget: Widget, msg: str) -> None:
+        """
+        Attaches a ToolTip to a widget, deferring its creation until the mouse first enters the widget.  Each ToolTip
+        is its own hidden Toplevel window, so creating them all up front slows down building the editor.
+
+        :param widget: Widget to show the tooltip for
+        :param msg: Text of the tooltip
+        """
+        def create_tooltip(event) -> None:
+            # Only fires once; the ToolTip binds its own <Enter> handler from here on
+            widget.unbind("<Enter>", binding)
+            ToolTip(widget, msg=msg).on_enter(event)
+        binding = widget.bind("<Enter>", create_tooltip, add="+")
+
     def add_descriptor(self, event=None) -> None:
         """ Modifies the current spell being edited by adding the selected descriptor. """
         descriptor = self.selected_descriptor.get()
-        descriptors = self.descriptors_lb.get(0, END)
-        if descriptors.count(descriptor) == 0:
+        if descriptor not in self.descriptors_lb.get(0, END):
             self.descriptors_lb.insert(0, descriptor)
 
     def remove_descriptor(self) -> None:
@@ -1308,23 +1280,20 @@ class SpellEditor(Frame):
 
         Updates the spell type (arcane/divine/psychic) checkboxes automatically.
         """
-        class_string = self.selected_class.get() + ":" + self.spell_level_spinbox.get()
-        classes = self.classes_lb.get(0, END)
-        class_already_in_list = False
-        for entry in classes:
-            if entry.count(self.selected_class.get()) > 0:
-                class_already_in_list = True
+        selected_class = self.selected_class.get()
+        class_string = selected_class + ":" + self.spell_level_spinbox.get()
+        class_already_in_list = any(entry.partition(":")[0] == selected_class for entry in self.classes_lb.get(0, END))
         if not class_already_in_list:
             self.classes_lb.insert(0, class_string)
-            class_name = class_string.split(":")[0]
+            class_name = selected_class
 
             # Check the box associated with the spellcasting type of the newly added class, if it isn't already
-            for spell_type in self.type_values.keys():
-                if class_name in self.caster_type[spell_type]:
-                    self.type_cb[spell_type].select()
+            spell_type = self.class_type.get(class_name)
+            if spell_type is not None:
+                self.type_cb[spell_type].select()
 
             # If Wizard is added, also add Sorcerer, since that appears to be PCGen .lst convention for PF1e/3.5e
-            if class_string.count("Wizard") > 0 and self.mode in ("Pathfinder 1e", "D&D 3.5e"):
+            if class_name == "Wizard" and self.mode in WIZARD_SORCERER_SYSTEMS:
                 self.classes_lb.insert(0, "Sorcerer" + ":" + self.spell_level_spinbox.get())
         else:
             messagebox.showerror("Class already in list",
@@ -1345,33 +1314,27 @@ class SpellEditor(Frame):
         except IndexError:
             messagebox.showerror("No class selected", "Please select a class from the list to remove.")
             return
-        class_name = self.classes_lb.get(index).split(":")[0]
+        class_name = self.classes_lb.get(index).partition(":")[0]
         self.classes_lb.delete(index)
+        # Fetch the remaining entries in one call and keep this copy in step with the Listbox, rather than making a
+        #  Tk round trip per index or re-reading the Listbox for the spell type check below
+        entries = list(self.classes_lb.get(0, END))
 
         # Make sure Wizards and Sorcerers are both removed from list together for PF1e/3.5e
-        if self.mode in ("Pathfinder 1e", "D&D 3.5e"):
-            if class_name == "Wizard":
-                for i in range(0, self.classes_lb.size()):
-                    if self.classes_lb.get(i).count("Sorcerer") > 0:
-                        self.classes_lb.delete(i)
-                        break
-            elif class_name == "Sorcerer":
-                for i in range(0, self.classes_lb.size()):
-                    if self.classes_lb.get(i).count("Wizard") > 0:
-                        self.classes_lb.delete(i)
-                        break
+        if self.mode in WIZARD_SORCERER_SYSTEMS and class_name in ("Wizard", "Sorcerer"):
+            companion = "Sorcerer" if class_name == "Wizard" else "Wizard"
+            for (i, entry) in enumerate(entries):
+                if entry.startswith(companion + ":"):
+                    self.classes_lb.delete(i)
+                    del entries[i]
+                    break
 
         # If there are no more casting classes of this spell type, uncheck the associated type box
-        for spell_type in self.caster_type.keys():
-            if class_name in self.caster_type[spell_type]:
-                casters_remaining = False
-                for entry in self.classes_lb.get(0, END):
-                    if entry.split(":")[0] in self.caster_type[spell_type]:
-                        casters_remaining = True
-                        break
-                if not casters_remaining:
-                    self.type_cb[spell_type].deselect()
-                break
+        spell_type = self.class_type.get(class_name)
+        if spell_type is not None:
+            casters_remaining = any(self.class_type.get(entry.partition(":")[0]) == spell_type for entry in entries)
+            if not casters_remaining:
+                self.type_cb[spell_type].deselect()
 
     def add_spell(self) -> None:
         """
@@ -1381,28 +1344,34 @@ class SpellEditor(Frame):
         If the spell already exists in the list, offers the option of overwriting the old spell (effectively
         editing/modifying it).
         """
+        is_5e = self.mode == "D&D 5e"
         classes = self.classes_lb.get(0, END)
         class_level_list = [[], [], [], [], [], [], [], [], [], []]
-        if len(self.spell_fields['name'].get()) == 0:
+        # Read each required field out of its widget once; every get() is a round trip to Tk
+        name = self.spell_fields['name'].get()
+        casting_time = self.spell_fields['casting_time'].get()
+        duration = self.spell_fields['duration'].get()
+        spell_range = self.spell_fields['range'].get()
+        if len(name) == 0:
             messagebox.showerror("Spell has no name", "Spell name is required.")
             return
         if len(classes) == 0:
             messagebox.showerror("No classes/spell level defined", "No classes defined with spell on their list.")
             return
-        if len(self.spell_fields['casting_time'].get()) == 0:
-            if self.mode == "D&D 5e":
+        if len(casting_time) == 0:
+            if is_5e:
                 messagebox.showerror("Spell has no casting time", "Spell casting time is required.  This is usually " +
                                      "\'1 action\'")
             else:
                 messagebox.showerror("Spell has no casting time", "Spell casting time is required.  This is usually " +
                                      "\'1 standard action\'")
             return
-        if len(self.spell_fields['duration'].get()) == 0:
+        if len(duration) == 0:
             messagebox.showerror("Spell has no duration", "Spell duration is required. Spells that do not last " +
                                  "beyond their initial effect generally have \'instantaneous\' duration.")
             return
-        if len(self.spell_fields['range'].get()) == 0:
-            if self.mode == "D&D 5e":
+        if len(spell_range) == 0:
+            if is_5e:
                 messagebox.showerror("Spell has no range", "Spell range is required. This value can be \'Self\' or " +
                                      "\'Touch\', for example.")
             else:
@@ -1411,33 +1380,36 @@ class SpellEditor(Frame):
             return
 
         for class_entry in classes:
-            (class_name, class_level) = class_entry.split(":")
-            class_level_list[int(class_level)].append(class_name)
-        spell = Spell(name=self.spell_fields['name'].get(), classes_by_level=class_level_list,
-                      school=self.selected_school.get(), casting_time=self.spell_fields['casting_time'].get(),
-                      spell_range=self.spell_fields['range'].get(), duration=self.spell_fields['duration'].get(),
+            (class_name, separator, class_level) = class_entry.partition(":")
+            class_level_list[int(class_level)].append(sys.intern(class_name))
+        spell = Spell(name=name, classes_by_level=class_level_list,
+                      school=self.selected_school.get(), subschool=self.selected_subschool.get(),
+                      casting_time=casting_time, spell_range=spell_range, duration=duration,
                       desc=self.spell_fields['desc'].get("1.0", "end"))
-        for field in self.spell_fields.keys():
-            if field not in ("desc", "other", "name", "sr") and len(self.spell_fields[field].get().strip()) > 0:
-                value = self.spell_fields[field].get().strip()
-                if field in ("range", "save") or (self.mode == "D&D 5e" and field == "duration"):
-                    value = value.lower().capitalize()
+        # Reuse the required fields already read above, so that only the remaining fields are read from Tk here
+        field_values = {'casting_time': casting_time, 'duration': duration, 'range': spell_range}
+        for (field, entry) in self.spell_fields.items():
+            if field in EDITOR_SPECIAL_FIELDS:
+                continue
+            value = (field_values[field] if field in field_values else entry.get()).strip()
+            if len(value) > 0:
+                if field in CAPITALIZED_FIELDS or (is_5e and field == "duration"):
+                    value = value.capitalize()
+                elif field in INTERNED_FIELDS:
+                    value = sys.intern(value)
                 spell.fields[field] = value
-        other_fields = self.spell_fields['other'].get("1.0", END).split("\t")
-        if len(other_fields) > 0:
-            for field in other_fields:
-                if len(field.strip()) > 0:
-                    spell.other_fields.append(field.strip())
-        for spell_type in self.type_cb.keys():
-            spell.type[spell_type] = self.type_values[spell_type].get()
-        for component in self.component_cb.keys():
-            spell.comps[component] = self.component_values[component].get()
-        if self.mode != "D&D 5e":
+        other_fields = (field.strip() for field in self.spell_fields['other'].get("1.0", END).split("\t"))
+        spell.other_fields.extend(field for field in other_fields if len(field) > 0)
+        for (spell_type, value) in self.type_values.items():
+            spell.type[spell_type] = value.get()
+        for (component, value) in self.component_values.items():
+            spell.comps[component] = value.get()
+        if not is_5e:
             spell.fields['sr'] = self.selected_sr.get()
             for descriptor in self.descriptors_lb.get(0, END):
                 spell.descriptors.append(descriptor)
 
-        spell.fields['subschool'] = self.selected_subschool.get()
+        spell.mark_dirty()
 
         self.generator.add_spell(spell)
 
@@ -1446,66 +1418,68 @@ class SpellEditor(Frame):
         Called as part of the 'edit spell' function.  This copies the characteristics of the selected spell into the
         corresponding GUI elements in the spell editing frame.
         """
-        for component in self.component_values.keys():
-            if spell.comps[component]:
-                self.component_cb[component].select()
-            else:
-                self.component_cb[component].deselect()
+        is_5e = self.mode == "D&D 5e"
+        # Set the checkbuttons' variables directly; each Checkbutton tracks its variable, so this updates the display
+        for (component, value) in self.component_values.items():
+            value.set(bool(spell.comps[component]))
         self.update_material_desc_field()
 
-        for field in spell.fields.keys():
+        spell_fields = self.spell_fields
+        for (field, value) in spell.fields.items():
             if field == "school":
-                self.selected_school.set(spell.fields[field])
+                self.selected_school.set(value)
                 self.update_subschool_choices()
             elif field == "subschool":
-                self.selected_subschool.set(spell.fields[field])
-            elif field == "sr" and self.mode != "D&D 5e":
-                if spell.fields[field].upper().count("YES") > 0:
-                    if spell.fields[field].upper().count("HARMLESS") > 0:
+                self.selected_subschool.set(value)
+            elif field == "sr" and not is_5e:
+                sr = value.upper()
+                if "YES" in sr:
+                    if "HARMLESS" in sr:
                         self.selected_sr.set("Yes (Harmless)")
                     else:
                         self.selected_sr.set("Yes")
-                elif spell.fields[field].upper().count("NONE") > 0 or len(spell.fields[field]) == 0:
+                elif "NONE" in sr or len(sr) == 0:
                     self.selected_sr.set("None")
                 else:
                     self.selected_sr.set("No")
-            elif field == "material_desc" and self.mode == "D&D 5e":
-                self.spell_fields['material_desc'].delete(0, END)
-                self.spell_fields['material_desc'].insert(0, spell.fields[field])
+            elif field == "material_desc" and is_5e:
+                spell_fields['material_desc'].delete(0, END)
+                spell_fields['material_desc'].insert(0, value)
             else:
-                if field != "desc" and field in self.spell_fields.keys():
-                    self.spell_fields[field].delete(0, END)
-                    self.spell_fields[field].insert(0, spell.fields[field])
+                if field != "desc" and field in spell_fields:
+                    spell_fields[field].delete(0, END)
+                    spell_fields[field].insert(0, value)
                 elif field == "desc":
-                    self.spell_fields[field].delete("1.0", END)
-                    self.spell_fields[field].insert(END, spell.fields[field])
+                    spell_fields[field].delete("1.0", END)
+                    spell_fields[field].insert(END, value)
 
         self.spell_fields['other'].delete("1.0", END)
-        for field in spell.other_fields:
-            self.spell_fields['other'].insert(END, field + "\t")
-        if self.mode != "D&D 5e":
+        self.spell_fields['other'].insert(END, "".join(field + "\t" for field in spell.other_fields))
+        if not is_5e:
             self.descriptors_lb.delete(0, END)
-            for descriptor in spell.descriptors:
-                self.descriptors_lb.insert(0, descriptor)
-        for spell_type in self.type_values.keys():
-            if spell.type[spell_type]:
-                self.type_cb[spell_type].select()
-            else:
-                self.type_cb[spell_type].deselect()
+            # Listed newest-first, as if each descriptor had been inserted at the top in turn
+            self.descriptors_lb.insert(END, *reversed(spell.descriptors))
+        for (spell_type, value) in self.type_values.items():
+            value.set(bool(spell.type[spell_type]))
 
         self.classes_lb.delete(0, END)
-        for level in range(0, 10):
-            for class_name in spell.classes[level]:
-                self.classes_lb.insert(self.classes_lb.size(), class_name + ":" + str(level))
+        self.classes_lb.insert(END, *[class_name + ":" + str(level) for (level, class_names) in enumerate(spell.classes)
+                                      for class_name in class_names])
 
     def update_subschool_choices(self, school: str = None) -> None:
         """ Refresh the list of available subschools to match the specified (or currently selected if none) school. """
         if school is None:
             school = self.selected_school.get()
+        # Many schools share the same choices (e.g., no subschools at all, or just Ritual in 5e), so skip the rebuild
+        #  unless they differ from what the menu already lists
+        subschools = self.subschools[school]
+        if subschools == self.subschool_menu_choices:
+            return
         menu = self.subschool_dropdown['menu']
         menu.delete(0, END)
-        for subschool in self.subschools[school]:
-            menu.add_command(label=subschool, command=lambda value=subschool: self.selected_subschool.set(value))
+        for subschool in subschools:
+            menu.add_command(label=subschool, command=partial(self.selected_subschool.set, subschool))
+        self.subschool_menu_choices = subschools
 
     def update_material_desc_field(self) -> None:
         if self.mode == "D&D 5e":
@@ -1519,16 +1493,6 @@ def main():
     sg = SpellGenerator()
     sg.run()
 
-    """
-    spell = Spell(name="Charitable Impulse", classes_by_level=[[],[],["Bard"],["Cleric","Sorcerer","Witch","Wizard"]],
-                  school="Enchantment", casting_time="1 standard action", range="Close", duration="(CASTERLEVEL) rounds",
-                  desc="This is a description of Charitable Impulse", arcane=True, divine=True, psychic=False,
-                  save="Will negates", sr="Yes", target="One humanoid creature", descriptors=["Mind-Affecting"],
-                  subschool="Compulsion", verbal=True, somatic=True, focus=True, divine_focus=True,
-                  other_fields=["SOURCEPAGE:p.50"])
-    print(spell)
-    """
-
 
 if __name__ == '__main__':
     main()